@@ -0,0 +1,267 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from config import get_env
+
+# Least recently seen clients are forgotten once this many are tracked per route
+MAX_TRACKED_CLIENTS = 10000
+
+
+class TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate, capacity, now):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def wait_time(self, now):
+        """Seconds until a token is available; 0 if one can be taken now."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self):
+        # Only call after wait_time() returned 0
+        self.tokens -= 1
+
+    def refund(self):
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+
+class RouteLimit:
+    """Limits for every request whose path starts with `prefix`.
+
+    `rate`/`burst` bound the route as a whole and `client_rate`/`client_burst`
+    bound each client on it. At most `max_in_flight` requests run at once; up to
+    `max_queue` more wait for a slot, but never longer than `max_queue_delay`
+    seconds. While the recent average queueing delay is above
+    `target_queue_delay`, requests that would have to queue are shed straight
+    away instead of waiting.
+    """
+
+    def __init__(
+        self,
+        prefix,
+        rate,
+        burst,
+        client_rate,
+        client_burst,
+        max_in_flight,
+        max_queue,
+        max_queue_delay,
+        target_queue_delay,
+    ):
+        self.prefix = prefix
+        self.rate = rate
+        self.burst = burst
+        self.client_rate = client_rate
+        self.client_burst = client_burst
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.max_queue_delay = max_queue_delay
+        self.target_queue_delay = target_queue_delay
+
+        self.bucket = TokenBucket(rate, burst, time.monotonic())
+        self.clients = OrderedDict()
+        self.semaphore = None
+        self.in_flight = 0
+        self.queued = 0
+        self.queue_delay = 0.0  # EWMA, seconds
+        self.counters = {
+            "admitted": 0,
+            "queued": 0,
+            "rate_limited_client": 0,
+            "rate_limited_route": 0,
+            "shed_queue_full": 0,
+            "shed_queue_delay": 0,
+            "shed_queue_timeout": 0,
+        }
+
+    def client_bucket(self, client, now):
+        bucket = self.clients.get(client)
+        if bucket is not None:
+            self.clients.move_to_end(client)
+            return bucket
+        if len(self.clients) >= MAX_TRACKED_CLIENTS:
+            self.clients.popitem(last=False)
+        bucket = self.clients[client] = TokenBucket(
+            self.client_rate, self.client_burst, now
+        )
+        return bucket
+
+    def record_queue_delay(self, delay):
+        self.queue_delay = 0.8 * self.queue_delay + 0.2 * delay
+
+    def snapshot(self):
+        return {
+            **self.counters,
+            "in_flight": self.in_flight,
+            "waiting": self.queued,
+            "queue_delay_ms": round(self.queue_delay * 1000, 3),
+            "tracked_clients": len(self.clients),
+            "limits": {
+                "rate": self.rate,
+                "burst": self.burst,
+                "client_rate": self.client_rate,
+                "client_burst": self.client_burst,
+                "max_in_flight": self.max_in_flight,
+                "max_queue": self.max_queue,
+                "max_queue_delay_ms": self.max_queue_delay * 1000,
+                "target_queue_delay_ms": self.target_queue_delay * 1000,
+            },
+        }
+
+
+class AdmissionController:
+    def __init__(self, routes):
+        # Longest prefix first so more specific routes win
+        self.routes = sorted(routes, key=lambda route: len(route.prefix), reverse=True)
+
+    def match(self, path):
+        for route in self.routes:
+            if path.startswith(route.prefix):
+                return route
+        return None
+
+    def snapshot(self):
+        return {route.prefix: route.snapshot() for route in self.routes}
+
+
+def default_routes(prefix="/api/sportsbooks"):
+    """Default limits, overridable through ADMISSION_* environment variables."""
+    client_rate = float(get_env("ADMISSION_CLIENT_RATE", "5"))
+    client_burst = float(get_env("ADMISSION_CLIENT_BURST", "10"))
+    max_in_flight = int(get_env("ADMISSION_MAX_IN_FLIGHT", "32"))
+    max_queue = int(get_env("ADMISSION_MAX_QUEUE", "64"))
+    max_queue_delay = float(get_env("ADMISSION_MAX_QUEUE_DELAY_MS", "500")) / 1000
+    target_queue_delay = (
+        float(get_env("ADMISSION_TARGET_QUEUE_DELAY_MS", "100")) / 1000
+    )
+
+    # Route rates guard the upstream quota. /odds gets the lowest default since it
+    # is the most expensive call: the Odds API charges per market and region.
+    route_rates = {
+        "/sports": ("SPORTS", "5", "10"),
+        "/odds/": ("ODDS", "1", "5"),
+        "/scores/": ("SCORES", "5", "10"),
+    }
+    return [
+        RouteLimit(
+            prefix + path,
+            float(get_env(f"ADMISSION_{name}_RATE", rate)),
+            float(get_env(f"ADMISSION_{name}_BURST", burst)),
+            client_rate,
+            client_burst,
+            max_in_flight,
+            max_queue,
+            max_queue_delay,
+            target_queue_delay,
+        )
+        for path, (name, rate, burst) in route_rates.items()
+    ]
+
+
+async def _reject(send, status, detail, retry_after):
+    body = b'{"detail":"' + detail.encode() + b'"}'
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+class AdmissionMiddleware:
+    """ASGI middleware applying an AdmissionController's limits.
+
+    Rejections are answered directly from here, before routing, dependency
+    injection or any DB work, so shedding stays cheap under overload.
+    """
+
+    def __init__(self, app, controller):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        route = self.controller.match(scope["path"])
+        if route is None:
+            return await self.app(scope, receive, send)
+
+        now = time.monotonic()
+        client = scope.get("client")
+        client = client[0] if client else "unknown"
+
+        # Check both buckets before taking from either, so a request rejected by
+        # one does not use up a token from the other
+        client_bucket = route.client_bucket(client, now)
+        retry_after = client_bucket.wait_time(now)
+        if retry_after:
+            route.counters["rate_limited_client"] += 1
+            return await _reject(send, 429, "Client rate limit exceeded", retry_after)
+        retry_after = route.bucket.wait_time(now)
+        if retry_after:
+            route.counters["rate_limited_route"] += 1
+            return await _reject(send, 429, "Route rate limit exceeded", retry_after)
+        client_bucket.take()
+        route.bucket.take()
+
+        if route.semaphore is None:
+            route.semaphore = asyncio.Semaphore(route.max_in_flight)
+        if not route.semaphore.locked():
+            await route.semaphore.acquire()
+            route.record_queue_delay(0.0)
+        else:
+            # Shed requests never reach upstream, so give both tokens back
+            if route.queued >= route.max_queue:
+                route.bucket.refund()
+                client_bucket.refund()
+                route.counters["shed_queue_full"] += 1
+                return await _reject(
+                    send, 503, "Server overloaded", route.max_queue_delay
+                )
+            if route.queue_delay > route.target_queue_delay:
+                route.bucket.refund()
+                client_bucket.refund()
+                route.counters["shed_queue_delay"] += 1
+                return await _reject(
+                    send, 503, "Server overloaded", route.queue_delay
+                )
+
+            route.queued += 1
+            route.counters["queued"] += 1
+            try:
+                await asyncio.wait_for(
+                    route.semaphore.acquire(), timeout=route.max_queue_delay
+                )
+            except asyncio.TimeoutError:
+                route.record_queue_delay(route.max_queue_delay)
+                route.bucket.refund()
+                client_bucket.refund()
+                route.counters["shed_queue_timeout"] += 1
+                return await _reject(
+                    send, 503, "Server overloaded", route.max_queue_delay
+                )
+            finally:
+                route.queued -= 1
+            route.record_queue_delay(time.monotonic() - now)
+
+        route.counters["admitted"] += 1
+        route.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            route.in_flight -= 1
+            route.semaphore.release()
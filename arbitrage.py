@@ -0,0 +1,56 @@
+def arbitrage_calculation(odd_data):
+    opportunities = []
+
+    for game in odd_data:
+        markets = {}
+
+        # Iterate through bookmakers and extract market information
+        for bookmaker in game.get("bookmakers", []):
+            for market in bookmaker.get("markets", []):
+                market_key = market["key"]
+                if market_key not in markets:
+                    markets[market_key] = []
+
+                for outcome in market.get("outcomes", []):
+                    price = outcome["price"]
+                    decimal_price = convert_to_decimal(price)
+                    markets[market_key].append(
+                        {
+                            "bookmaker": bookmaker["title"],
+                            "outcome_name": outcome["name"],
+                            "price": decimal_price,
+                        }
+                    )
+
+        # Check arbitrage for each market
+        for market_key, outcomes in markets.items():
+            best_odds = {}
+            for outcome in outcomes:
+                name = outcome["outcome_name"]
+                if name not in best_odds or outcome["price"] > best_odds[name]["price"]:
+                    best_odds[name] = outcome
+
+            # Calculate implied probabilities
+            implied_prob = {name: 1 / data["price"] for name, data in best_odds.items()}
+            total_prob = sum(implied_prob.values())
+
+            # If total probability is less than 1, it's an arbitrage opportunity
+            if total_prob < 1:
+                opportunities.append(
+                    {
+                        "game_id": game["id"],
+                        "market": market_key,
+                        "profit_percentage": (1 - total_prob) * 100,
+                        "best_odds": best_odds,
+                    }
+                )
+
+    return opportunities
+
+
+def convert_to_decimal(price):
+    """Converts American odds to decimal odds."""
+    if price > 0:
+        return (price / 100) + 1
+    else:
+        return (100 / abs(price)) + 1
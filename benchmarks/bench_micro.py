@@ -0,0 +1,53 @@
+"""Micro-benchmarks for the pure odds helpers in arbitrage.py."""
+
+import time
+
+from arbitrage import arbitrage_calculation, convert_to_decimal
+from benchmarks.mock_oddsapi import generate_odds
+from benchmarks.results import summarize
+
+
+def _time_calls(func, args, repeat, number):
+    """Run `func(*args)` `number` times per sample; return per-call times in µs."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(*args)
+        samples.append((time.perf_counter() - start) / number * 1e6)
+    return samples
+
+
+def _time_conversions(prices, repeat, number):
+    """Per-call times in µs for `convert_to_decimal`, called directly in the loop."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            for price in prices:
+                convert_to_decimal(price)
+        samples.append((time.perf_counter() - start) / (number * len(prices)) * 1e6)
+    return samples
+
+
+def run(games=(10, 100), bookmakers=8, markets=("h2h", "spreads"), repeat=30):
+    results = {}
+
+    prices = [-110, 150, -250, 320, 100, -105]
+    stats = summarize(_time_conversions(prices, repeat, 10000), unit="us")
+    stats["calls_per_sec"] = 1e6 / stats["p50_us"] if stats["p50_us"] else 0.0
+    results["micro.convert_to_decimal"] = stats
+
+    for num_games in games:
+        odds_data = generate_odds("bench_sport", num_games, bookmakers, markets)
+        number = max(1, 2000 // num_games)
+        stats = summarize(
+            _time_calls(arbitrage_calculation, (odds_data,), repeat, number), unit="us"
+        )
+        stats["games_per_sec"] = (
+            num_games * 1e6 / stats["p50_us"] if stats["p50_us"] else 0.0
+        )
+        stats["opportunities"] = len(arbitrage_calculation(odds_data))
+        results[f"micro.arbitrage_calculation.games{num_games}"] = stats
+
+    return results
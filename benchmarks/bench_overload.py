@@ -0,0 +1,150 @@
+"""Overload benchmark for the admission middleware.
+
+Serves an app whose handler holds one of `capacity` backend slots for
+`service_ms` (standing in for the upstream call) from a separate uvicorn
+process, offers it more load than it can serve once without admission control
+and once with it, and reports latency of admitted and shed requests separately.
+"""
+
+import asyncio
+import multiprocessing
+import time
+
+from benchmarks.net import free_port
+from benchmarks.results import summarize
+
+PREFIX = "/api/sportsbooks/odds/"
+
+
+def _serve(port, service_ms, capacity, limits):
+    import uvicorn
+    from fastapi import FastAPI
+
+    from admission import AdmissionController, AdmissionMiddleware, RouteLimit
+
+    app = FastAPI()
+    backend = asyncio.Semaphore(capacity)
+
+    @app.get(PREFIX + "{sport_key}")
+    async def odds(sport_key: str):
+        async with backend:
+            await asyncio.sleep(service_ms / 1000)
+        return {"success": True, "sport": sport_key}
+
+    if limits is not None:
+        controller = AdmissionController([RouteLimit(PREFIX, **limits)])
+        app.add_middleware(AdmissionMiddleware, controller=controller)
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="error")
+
+
+async def _connect(port):
+    for _ in range(100):
+        try:
+            return await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError("Benchmark server did not start")
+
+
+async def _get(reader, writer, path):
+    # Minimal keep-alive HTTP/1.1 client; httpx's pool costs more CPU than the
+    # server under test at these concurrencies.
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: bench\r\n\r\n".encode())
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":", 1)[1])
+    await reader.readexactly(length)
+    return status
+
+
+async def _drive(port, rate, duration):
+    admitted, shed = [], []
+    statuses = {}
+    idle = [await _connect(port)]
+
+    async def request():
+        reader, writer = idle.pop() if idle else await _connect(port)
+        start = time.perf_counter()
+        status = await _get(reader, writer, PREFIX + "bench")
+        latency = (time.perf_counter() - start) * 1000
+        idle.append((reader, writer))
+        statuses[status] = statuses.get(status, 0) + 1
+        (admitted if status == 200 else shed).append(latency)
+
+    # Open loop: arrivals keep coming at `rate` however slowly the server answers
+    tasks = []
+    start = time.perf_counter()
+    for i in range(int(rate * duration)):
+        delay = start + i / rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(request()))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    for _, writer in idle:
+        writer.close()
+    return admitted, shed, statuses, elapsed
+
+
+def _measure(service_ms, capacity, limits, rate, duration):
+    port = free_port()
+    server = multiprocessing.Process(
+        target=_serve, args=(port, service_ms, capacity, limits), daemon=True
+    )
+    server.start()
+    try:
+        return asyncio.run(_drive(port, rate, duration))
+    finally:
+        server.terminate()
+        server.join()
+
+
+def _stats(samples, elapsed):
+    if not samples:
+        return {"count": 0, "rps": 0.0}
+    stats = summarize(samples, unit="ms")
+    stats["count"] = len(samples)
+    stats["rps"] = len(samples) / elapsed
+    return stats
+
+
+def run(service_ms=50, capacity=8, overload=2.0, duration=3.0):
+    """Offer `overload` times the backend's capacity of `capacity` concurrent
+    calls of `service_ms` each."""
+    rate = overload * capacity * 1000 / service_ms
+    results = {}
+
+    admitted, _, _, elapsed = _measure(service_ms, capacity, None, rate, duration)
+    results["overload.uncontrolled"] = _stats(admitted, elapsed)
+
+    # Rates are left effectively unlimited so only in-flight/queue shedding applies
+    limits = {
+        "rate": 1e9,
+        "burst": 1e9,
+        "client_rate": 1e9,
+        "client_burst": 1e9,
+        "max_in_flight": capacity,
+        "max_queue": capacity * 2,
+        "max_queue_delay": service_ms * 4 / 1000,
+        "target_queue_delay": service_ms * 2 / 1000,
+    }
+    admitted, shed, statuses, elapsed = _measure(
+        service_ms, capacity, limits, rate, duration
+    )
+    results["overload.admission.admitted"] = _stats(admitted, elapsed)
+    shed_stats = _stats(shed, elapsed)
+    # A higher shed rate is not an improvement, so keep it out of comparisons
+    shed_stats.pop("rps")
+    shed_stats.update(
+        {
+            f"status_{status}": count
+            for status, count in sorted(statuses.items())
+            if status != 200
+        }
+    )
+    results["overload.admission.shed"] = shed_stats
+    return results
@@ -0,0 +1,76 @@
+"""End-to-end throughput and latency for the FastAPI routes.
+
+Expects the app to be running with ODDS_API_BASE_URL pointing at the mock
+server, so no real quota is used.
+"""
+
+import asyncio
+import time
+
+import httpx
+
+from benchmarks.results import summarize
+
+
+async def _load(client, url, params, concurrency, total_requests):
+    latencies = []
+    errors = 0
+    remaining = total_requests
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                response = await client.get(url, params=params)
+                if response.status_code != 200:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    stats = summarize(latencies, unit="ms")
+    stats["rps"] = len(latencies) / elapsed if elapsed else 0.0
+    stats["errors"] = errors
+    return stats
+
+
+async def _run(app_url, concurrency_levels, requests_per_level, sport_key):
+    limits = httpx.Limits(max_connections=max(concurrency_levels))
+    async with httpx.AsyncClient(
+        base_url=app_url.rstrip("/"), limits=limits, timeout=30
+    ) as client:
+        # /sports populates the sports table, which /odds checks before fetching
+        response = await client.get("/sports")
+        response.raise_for_status()
+        if sport_key is None:
+            sport_key = response.json()["sports"][0]["key"]
+
+        routes = {
+            "sports": ("/sports", {}),
+            "odds": (f"/odds/{sport_key}", {"markets": "h2h,spreads"}),
+            "scores": (f"/scores/{sport_key}", {"days_from": 1}),
+        }
+        results = {}
+        for name, (path, params) in routes.items():
+            for concurrency in concurrency_levels:
+                results[f"route.{name}.c{concurrency}"] = await _load(
+                    client, path, params, concurrency, requests_per_level
+                )
+        return results
+
+
+def run(
+    app_url="http://127.0.0.1:8000/api/sportsbooks",
+    concurrency_levels=(1, 10, 50),
+    requests_per_level=200,
+    sport_key=None,
+):
+    return asyncio.run(
+        _run(app_url, concurrency_levels, requests_per_level, sport_key)
+    )
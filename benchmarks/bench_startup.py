@@ -0,0 +1,86 @@
+"""Cold-start benchmark: time to import `main` and build the app with
+`create_app()`, and time until /ready reports 200.
+
+Each sample uses a fresh interpreter. Time to ready needs DATABASE_URL to point
+at a reachable database; without one only import and listen times are reported.
+"""
+
+import subprocess
+import sys
+import time
+
+import httpx
+
+from benchmarks.net import free_port
+from benchmarks.results import summarize
+
+IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); import main; main.create_app(); "
+    "print((time.perf_counter() - start) * 1000)"
+)
+
+
+def _import_ms():
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def _serve_once(ready_timeout):
+    """Return (ms until the server answers, ms until /ready is 200 or None)."""
+    port = free_port()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:create_app",
+            "--factory",
+            "--port",
+            str(port),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    start = time.perf_counter()
+    listen_ms = ready_ms = None
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}") as client:
+            while time.perf_counter() - start < ready_timeout:
+                try:
+                    response = client.get("/ready")
+                except httpx.TransportError:
+                    time.sleep(0.02)
+                    continue
+                elapsed = (time.perf_counter() - start) * 1000
+                if listen_ms is None:
+                    listen_ms = elapsed
+                if response.status_code == 200:
+                    ready_ms = elapsed
+                    break
+                time.sleep(0.02)
+    finally:
+        server.terminate()
+        server.wait()
+    return listen_ms, ready_ms
+
+
+def run(repeat=5, ready_timeout=15.0):
+    results = {"startup.import": summarize([_import_ms() for _ in range(repeat)])}
+
+    listen, ready = [], []
+    for _ in range(repeat):
+        listen_ms, ready_ms = _serve_once(ready_timeout)
+        if listen_ms is not None:
+            listen.append(listen_ms)
+        if ready_ms is not None:
+            ready.append(ready_ms)
+    if listen:
+        results["startup.listen"] = summarize(listen)
+    if ready:
+        results["startup.ready"] = summarize(ready)
+    return results
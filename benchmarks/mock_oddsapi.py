@@ -0,0 +1,263 @@
+"""Local stand-in for The Odds API v4.
+
+Serves /sports, /sports/{sport_key}/odds and /sports/{sport_key}/scores with
+generated payloads shaped like the real ones. Run the app against it by setting
+ODDS_API_BASE_URL=http://127.0.0.1:9000/v4.
+
+    python -m benchmarks.mock_oddsapi --port 9000 --games 20 --latency-ms 50
+"""
+
+import argparse
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+
+from fastapi import FastAPI, HTTPException, Query
+
+GROUPS = ["American Football", "Basketball", "Baseball", "Ice Hockey", "Soccer"]
+BOOKMAKERS = [
+    ("draftkings", "DraftKings"),
+    ("fanduel", "FanDuel"),
+    ("betmgm", "BetMGM"),
+    ("williamhill_us", "Caesars"),
+    ("pointsbetus", "PointsBet (US)"),
+    ("betrivers", "BetRivers"),
+    ("bovada", "Bovada"),
+    ("mybookieag", "MyBookie.ag"),
+    ("betonlineag", "BetOnline.ag"),
+    ("lowvig", "LowVig.ag"),
+    ("unibet_us", "Unibet"),
+    ("wynnbet", "WynnBET"),
+]
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _iso(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _to_american(decimal_price):
+    if decimal_price >= 2:
+        return int(round((decimal_price - 1) * 100))
+    return int(round(-100 / (decimal_price - 1)))
+
+
+def generate_sports(num_sports):
+    sports = []
+    for i in range(num_sports):
+        group = GROUPS[i % len(GROUPS)]
+        sports.append(
+            {
+                "key": f"mock_sport_{i}",
+                "group": group,
+                "title": f"Mock {group} League {i}",
+                "description": f"Generated {group.lower()} league",
+                "active": True,
+                "has_outrights": i % 7 == 0,
+            }
+        )
+    return sports
+
+
+def _fair_prices(rng, market):
+    # Fair two-way line; the bookmaker margin and noise are applied per book.
+    p_home = rng.uniform(0.25, 0.75)
+    if market == "totals":
+        return [("Over", 0.5), ("Under", 0.5)]
+    return [("home", p_home), ("away", 1 - p_home)]
+
+
+def generate_odds(
+    sport_key,
+    num_games,
+    num_bookmakers,
+    markets=("h2h",),
+    odds_format="american",
+    seed=0,
+):
+    """Generate an odds payload; the same arguments always yield the same data."""
+    rng = random.Random(f"{seed}:{sport_key}:odds")
+    bookmakers = BOOKMAKERS[: max(1, min(num_bookmakers, len(BOOKMAKERS)))]
+    games = []
+    for g in range(num_games):
+        home_team = f"Home Team {g}"
+        away_team = f"Away Team {g}"
+        commence_time = BASE_TIME + timedelta(hours=g)
+        fair = {market: _fair_prices(rng, market) for market in markets}
+        point = round(rng.uniform(-10, 10) * 2) / 2
+        total = round(rng.uniform(35, 230) * 2) / 2
+
+        game_bookmakers = []
+        for book_key, book_title in bookmakers:
+            last_update = _iso(commence_time - timedelta(minutes=rng.randint(1, 600)))
+            book_markets = []
+            for market in markets:
+                margin = rng.uniform(0.02, 0.06)
+                outcomes = []
+                for side, prob in fair[market]:
+                    # Noise occasionally pushes a book past fair value, which is
+                    # what produces arbitrage opportunities across books.
+                    implied = prob * (1 + margin) + rng.gauss(0, 0.007)
+                    decimal_price = round(1 / min(max(implied, 0.02), 0.98), 2)
+                    price = (
+                        decimal_price
+                        if odds_format == "decimal"
+                        else _to_american(decimal_price)
+                    )
+                    name = {"home": home_team, "away": away_team}.get(side, side)
+                    outcome = {"name": name, "price": price}
+                    if market == "spreads":
+                        outcome["point"] = point if side == "home" else -point
+                    elif market == "totals":
+                        outcome["point"] = total
+                    outcomes.append(outcome)
+                book_markets.append(
+                    {"key": market, "last_update": last_update, "outcomes": outcomes}
+                )
+            game_bookmakers.append(
+                {
+                    "key": book_key,
+                    "title": book_title,
+                    "last_update": last_update,
+                    "markets": book_markets,
+                }
+            )
+
+        games.append(
+            {
+                "id": f"{sport_key}_{g:05d}",
+                "sport_key": sport_key,
+                "sport_title": sport_key.replace("_", " ").title(),
+                "commence_time": _iso(commence_time),
+                "home_team": home_team,
+                "away_team": away_team,
+                "bookmakers": game_bookmakers,
+            }
+        )
+    return games
+
+
+def generate_scores(sport_key, num_games, days_from=None, seed=0):
+    rng = random.Random(f"{seed}:{sport_key}:scores")
+    scores = []
+    for g in range(num_games):
+        home_team = f"Home Team {g}"
+        away_team = f"Away Team {g}"
+        commence_time = BASE_TIME + timedelta(hours=g)
+        completed = days_from is not None and g % 2 == 0
+        live = not completed and g % 3 == 0
+        game_scores = None
+        if completed or live:
+            game_scores = [
+                {"name": home_team, "score": str(rng.randint(0, 120))},
+                {"name": away_team, "score": str(rng.randint(0, 120))},
+            ]
+        scores.append(
+            {
+                "id": f"{sport_key}_{g:05d}",
+                "sport_key": sport_key,
+                "sport_title": sport_key.replace("_", " ").title(),
+                "commence_time": _iso(commence_time),
+                "completed": completed,
+                "home_team": home_team,
+                "away_team": away_team,
+                "scores": game_scores,
+                "last_update": _iso(commence_time + timedelta(hours=3))
+                if completed
+                else None,
+            }
+        )
+    return scores
+
+
+def create_app(
+    num_sports=30,
+    num_games=20,
+    num_bookmakers=8,
+    latency_ms=0.0,
+    jitter_ms=0.0,
+    seed=0,
+):
+    app = FastAPI(title="Mock Odds API")
+    sports = generate_sports(num_sports)
+    sport_keys = {sport["key"] for sport in sports}
+    # Payloads are generated once per parameter set so the mock is never the bottleneck
+    cache = {}
+
+    async def simulate_latency():
+        delay = latency_ms + (random.uniform(-jitter_ms, jitter_ms) if jitter_ms else 0)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+    def check_sport(sport_key):
+        if sport_key not in sport_keys:
+            raise HTTPException(status_code=404, detail="Unknown sport")
+
+    @app.get("/v4/sports")
+    async def get_sports(apiKey: str = Query(None)):
+        await simulate_latency()
+        return sports
+
+    @app.get("/v4/sports/{sport_key}/odds")
+    async def get_odds(
+        sport_key: str,
+        apiKey: str = Query(None),
+        regions: str = Query("us"),
+        markets: str = Query("h2h"),
+        oddsFormat: str = Query("american"),
+        dateFormat: str = Query("iso"),
+    ):
+        check_sport(sport_key)
+        await simulate_latency()
+        market_list = tuple(m.strip() for m in markets.split(",") if m.strip())
+        cache_key = ("odds", sport_key, market_list, oddsFormat)
+        if cache_key not in cache:
+            cache[cache_key] = generate_odds(
+                sport_key, num_games, num_bookmakers, market_list, oddsFormat, seed
+            )
+        return cache[cache_key]
+
+    @app.get("/v4/sports/{sport_key}/scores")
+    async def get_scores(
+        sport_key: str,
+        apiKey: str = Query(None),
+        daysFrom: int = Query(None),
+        dateFormat: str = Query("iso"),
+    ):
+        check_sport(sport_key)
+        await simulate_latency()
+        cache_key = ("scores", sport_key, daysFrom)
+        if cache_key not in cache:
+            cache[cache_key] = generate_scores(sport_key, num_games, daysFrom, seed)
+        return cache[cache_key]
+
+    return app
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run a mock Odds API v4 server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--sports", type=int, default=30, help="Number of sports")
+    parser.add_argument("--games", type=int, default=20, help="Games per sport")
+    parser.add_argument("--bookmakers", type=int, default=8, help="Books per game")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    app = create_app(
+        num_sports=args.sports,
+        num_games=args.games,
+        num_bookmakers=args.bookmakers,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        seed=args.seed,
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""Networking helpers shared by the benchmarks that start their own servers."""
+
+import socket
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
@@ -0,0 +1,106 @@
+"""Helpers for summarising, saving and comparing benchmark results.
+
+A results file maps benchmark names to flat metric dicts, e.g.
+
+    {"meta": {...}, "results": {"micro.convert_to_decimal": {"p50_us": 0.08, ...}}}
+
+so two runs can be compared metric by metric.
+"""
+
+import json
+import os
+import platform
+import sys
+from datetime import datetime, timezone
+
+# Metrics where a larger number is an improvement; the other compared metrics
+# are costs (latency, errors) where larger is a regression.
+HIGHER_IS_BETTER = ("per_sec", "rps")
+# Only these are compared between runs. Tail percentiles from a few dozen
+# samples are too noisy, and counts such as `opportunities` are not performance.
+COMPARED_PREFIXES = ("p50_", "p95_")
+COMPARED_NAMES = ("errors",)
+# Suites that take only a handful of samples per benchmark (30 for micro, 5 for
+# startup), where p95 is the second-largest sample or the max; compare p50 only.
+P50_ONLY_SUITES = ("micro.", "startup.")
+
+
+def is_compared(name, metric):
+    if name.startswith(P50_ONLY_SUITES) and metric.startswith("p95_"):
+        return False
+    return (
+        metric.startswith(COMPARED_PREFIXES)
+        or metric.endswith(HIGHER_IS_BETTER)
+        or metric in COMPARED_NAMES
+    )
+
+
+def percentile(sorted_samples, pct):
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(round(pct / 100 * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+def summarize(samples, unit="ms"):
+    """Summarise a list of latencies (already in `unit`) into p50/p95/p99/mean/max."""
+    ordered = sorted(samples)
+    count = len(ordered)
+    return {
+        f"mean_{unit}": sum(ordered) / count if count else 0.0,
+        f"p50_{unit}": percentile(ordered, 50),
+        f"p95_{unit}": percentile(ordered, 95),
+        f"p99_{unit}": percentile(ordered, 99),
+        f"max_{unit}": ordered[-1] if count else 0.0,
+    }
+
+
+def save_results(results, path, meta=None):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    payload = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            **(meta or {}),
+        },
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+    return payload
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare_results(baseline, current, threshold_pct=10.0):
+    """Return (name, metric, baseline, current, change_pct) rows that regressed.
+
+    Only benchmarks present in both runs, and metrics accepted by
+    `is_compared`, are compared.
+    """
+    regressions = []
+    for name, metrics in current.items():
+        if name not in baseline:
+            continue
+        for metric, value in metrics.items():
+            if not is_compared(name, metric):
+                continue
+            old = baseline[name].get(metric)
+            if not isinstance(old, (int, float)) or not isinstance(value, (int, float)):
+                continue
+            if old == 0:
+                # Going from zero errors to some errors is always worth flagging
+                if value > 0 and not metric.endswith(HIGHER_IS_BETTER):
+                    regressions.append((name, metric, old, value, float("inf")))
+                continue
+            change_pct = (value - old) / abs(old) * 100
+            worse = -change_pct if metric.endswith(HIGHER_IS_BETTER) else change_pct
+            if worse > threshold_pct:
+                regressions.append((name, metric, old, value, change_pct))
+    return regressions
@@ -0,0 +1,84 @@
+"""Run the benchmark suite, save the results and optionally compare to a baseline.
+
+    python -m benchmarks.run --suite micro
+    python -m benchmarks.run --suite overload startup
+    python -m benchmarks.run --suite micro routes --compare benchmarks/results/baseline.json
+"""
+
+import argparse
+import sys
+
+from benchmarks.results import compare_results, load_results, save_results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run BetBridge benchmarks.")
+    parser.add_argument(
+        "--suite",
+        nargs="+",
+        choices=["micro", "routes", "overload", "startup"],
+        default=["micro"],
+        help="Benchmark suites to run",
+    )
+    parser.add_argument("--app-url", default="http://127.0.0.1:8000/api/sportsbooks")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--requests", type=int, default=200, help="Requests per level")
+    parser.add_argument("--output", default="benchmarks/results/latest.json")
+    parser.add_argument("--compare", help="Baseline results file to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=10.0, help="Allowed regression in percent"
+    )
+    args = parser.parse_args()
+
+    results = {}
+    if "micro" in args.suite:
+        from benchmarks import bench_micro
+
+        results.update(bench_micro.run())
+    if "routes" in args.suite:
+        from benchmarks import bench_routes
+
+        results.update(
+            bench_routes.run(args.app_url, tuple(args.concurrency), args.requests)
+        )
+    if "overload" in args.suite:
+        from benchmarks import bench_overload
+
+        results.update(bench_overload.run())
+    if "startup" in args.suite:
+        from benchmarks import bench_startup
+
+        results.update(bench_startup.run())
+
+    save_results(
+        results,
+        args.output,
+        meta={
+            "suites": args.suite,
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+        },
+    )
+
+    for name, metrics in sorted(results.items()):
+        summary = ", ".join(
+            f"{metric}={value:.2f}" if isinstance(value, float) else f"{metric}={value}"
+            for metric, value in metrics.items()
+        )
+        print(f"{name}: {summary}")
+    print(f"\nResults saved to {args.output}")
+
+    if args.compare:
+        regressions = compare_results(load_results(args.compare), results, args.threshold)
+        if not regressions:
+            print(f"No regressions beyond {args.threshold:.0f}% against {args.compare}")
+            return 0
+        print(f"\nRegressions beyond {args.threshold:.0f}% against {args.compare}:")
+        for name, metric, old, new, change in regressions:
+            print(f"  {name} {metric}: {old:.2f} -> {new:.2f} ({change:+.1f}%)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
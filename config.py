@@ -0,0 +1,14 @@
+import os
+from functools import lru_cache
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=None)
+def load_env():
+    """Load .env into the environment on first use rather than at import."""
+    load_dotenv()
+
+
+def get_env(name, default=None):
+    load_env()
+    return os.getenv(name, default)
@@ -7,19 +7,31 @@ from sqlalchemy import (
     TIMESTAMP,
     JSON,
     ForeignKey,
+    text,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-import os
+import threading
+from config import get_env
 
-# Load DB URL from environment
-DATABASE_URL = os.getenv("DATABASE_URL")
-
-# Initialize DB connection
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# The engine is created on first use so importing this module never touches the DB
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
 Base = declarative_base()
 
+_engine = None
+_schema_ready = False
+_lock = threading.Lock()
+
+
+def get_engine():
+    global _engine
+    if _engine is None:
+        with _lock:
+            if _engine is None:
+                _engine = create_engine(get_env("DATABASE_URL"), pool_pre_ping=True)
+                SessionLocal.configure(bind=_engine)
+    return _engine
+
 
 # Define Sports table
 class Sport(Base):
@@ -63,6 +75,43 @@ class Bookmaker(Base):
     market_point = Column(String(50), nullable=True)
 
 
-# Initialize the database
+# Initialize the database; the schema check runs once per process
 def init_db():
-    Base.metadata.create_all(bind=engine)
+    global _schema_ready
+    if _schema_ready:
+        return
+    engine = get_engine()
+    with _lock:
+        if not _schema_ready:
+            Base.metadata.create_all(bind=engine)
+            _schema_ready = True
+
+
+# Schema creation is left to the startup warm-up so requests never wait on it
+def get_session():
+    get_engine()
+    return SessionLocal()
+
+
+# Sport keys known to exist in the sports table, so /odds can skip the DB lookup
+sport_registry = set()
+
+
+def load_sport_registry():
+    db = get_session()
+    try:
+        sport_registry.update(key for (key,) in db.query(Sport.sport_key))
+    finally:
+        db.close()
+    return len(sport_registry)
+
+
+# Open a connection up front so the first request does not pay for it
+def warm_pool():
+    with get_engine().connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+def dispose_engine():
+    if _engine is not None:
+        _engine.dispose()
@@ -1,21 +1,69 @@
+import time
+
+# Taken before the heavier imports so startup time covers them too
+STARTED_AT = time.perf_counter()
+
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from admission import AdmissionController, AdmissionMiddleware, default_routes
+from config import get_env
+from db import dispose_engine
 from routes.oddsapi import router as sportsbooks_router
+from startup import readiness, warm_up
+from upstream import close_client
+
+
+@asynccontextmanager
+async def lifespan(app):
+    # Warm up in the background so the server starts accepting requests at once
+    warmup = asyncio.create_task(warm_up(STARTED_AT))
+    yield
+    warmup.cancel()
+    # Let a cancelled warm-up step finish with the engine before disposing it
+    with suppress(asyncio.CancelledError):
+        await warmup
+    await close_client()
+    dispose_engine()
+
+
+def create_app():
+    """Build the app. Called by uvicorn at server start (`--factory`), so
+    importing this module does not load .env or read any configuration.
+
+    Call it once per process: the readiness state, DB engine, sports registry
+    and Odds API client are module-level and shared by every app built here,
+    and one app's shutdown closes the client and engine for all of them.
+    """
+    app = FastAPI(lifespan=lifespan)
+    admission = AdmissionController(default_routes(prefix="/api/sportsbooks"))
+
+    # Added first so it runs inside CORS and browsers can read 429/503 responses
+    if get_env("ADMISSION_ENABLED", "1") != "0":
+        app.add_middleware(AdmissionMiddleware, controller=admission)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
-app = FastAPI()
+    # Include the routes
+    app.include_router(sportsbooks_router, prefix="/api/sportsbooks")
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    @app.get("/")
+    def root():
+        return {"message": "Sports Betting API is running!"}
 
-# Include the routes
-app.include_router(sportsbooks_router, prefix="/api/sportsbooks")
+    @app.get("/ready")
+    def ready():
+        return JSONResponse(readiness, status_code=200 if readiness["ready"] else 503)
 
+    @app.get("/admission/metrics")
+    def admission_metrics():
+        return admission.snapshot()
 
-@app.get("/")
-def root():
-    return {"message": "Sports Betting API is running!"}
+    return app
@@ -0,0 +1,65 @@
+import asyncio
+import logging
+import time
+from starlette.concurrency import run_in_threadpool
+from db import init_db, load_sport_registry, warm_pool
+from upstream import get_client
+
+logger = logging.getLogger("uvicorn.error")
+
+# Seconds between warm-up attempts while a dependency (usually the DB) is down
+RETRY_DELAYS = [1, 2, 5, 10]
+
+readiness = {
+    "ready": False,
+    "startup_ms": None,
+    "warmup_ms": None,
+    "attempts": 0,
+    "steps": {},
+    "error": None,
+}
+
+
+async def _timed(name, func):
+    start = time.perf_counter()
+    result = await run_in_threadpool(func)
+    readiness["steps"][name] = round((time.perf_counter() - start) * 1000, 1)
+    return result
+
+
+async def warm_up(started_at):
+    """Warm the DB schema, connection pool, sports registry and upstream client.
+
+    Runs in the background after the app starts serving; retries until every
+    step succeeds so the app comes up even if the DB is not ready yet.
+    """
+    warmup_started = time.perf_counter()
+    readiness["startup_ms"] = round((warmup_started - started_at) * 1000, 1)
+    while True:
+        readiness["attempts"] += 1
+        try:
+            await _timed("schema", init_db)
+            await _timed("connection_pool", warm_pool)
+            sports = await _timed("sports_registry", load_sport_registry)
+            get_client()
+            break
+        except Exception as e:
+            readiness["error"] = str(e)
+            delay = RETRY_DELAYS[min(readiness["attempts"], len(RETRY_DELAYS)) - 1]
+            logger.warning(
+                "Warm-up attempt %d failed, retrying in %ds: %s",
+                readiness["attempts"],
+                delay,
+                e,
+            )
+            await asyncio.sleep(delay)
+
+    readiness["warmup_ms"] = round((time.perf_counter() - warmup_started) * 1000, 1)
+    readiness["error"] = None
+    readiness["ready"] = True
+    logger.info(
+        "Ready: startup %.1fms, warm-up %.1fms (%d sports cached)",
+        readiness["startup_ms"],
+        readiness["warmup_ms"],
+        sports,
+    )
@@ -0,0 +1,178 @@
+import asyncio
+
+import pytest
+
+import admission
+from admission import AdmissionController, AdmissionMiddleware, RouteLimit
+
+PREFIX = "/api/sportsbooks/odds/"
+UNLIMITED = 1e9
+
+
+def make_route(**overrides):
+    # Tests that count tokens use rates of 1e-9/s so buckets barely refill
+    limits = {
+        "rate": UNLIMITED,
+        "burst": UNLIMITED,
+        "client_rate": UNLIMITED,
+        "client_burst": UNLIMITED,
+        "max_in_flight": 10,
+        "max_queue": 10,
+        "max_queue_delay": 1.0,
+        "target_queue_delay": 1.0,
+    }
+    limits.update(overrides)
+    return RouteLimit(PREFIX, **limits)
+
+
+def make_middleware(route, delay=0.0):
+    async def app(scope, receive, send):
+        if delay:
+            await asyncio.sleep(delay)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    return AdmissionMiddleware(app, AdmissionController([route]))
+
+
+async def call(middleware, client="10.0.0.1", path=PREFIX + "nba"):
+    response = {}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = dict(message["headers"])
+
+    scope = {"type": "http", "path": path, "client": (client, 5000)}
+    await middleware(scope, None, send)
+    return response["status"], response["headers"].get(b"retry-after")
+
+
+def run_concurrently(*calls):
+    async def main():
+        first = asyncio.create_task(calls[0])
+        # Let the first request take its in-flight slot before the rest arrive
+        await asyncio.sleep(0.01)
+        rest = [asyncio.create_task(c) for c in calls[1:]]
+        return await asyncio.gather(first, *rest)
+
+    return asyncio.run(main())
+
+
+def test_unmatched_path_passes_through():
+    middleware = make_middleware(make_route(rate=1e-9, burst=0))
+    assert asyncio.run(call(middleware, path="/ready")) == (200, None)
+
+
+def test_client_rate_limit_returns_429_with_retry_after():
+    route = make_route(client_rate=0.5, client_burst=1)
+    middleware = make_middleware(route)
+
+    assert asyncio.run(call(middleware)) == (200, None)
+    assert asyncio.run(call(middleware)) == (429, b"2")
+    # Another client has its own bucket
+    assert asyncio.run(call(middleware, client="10.0.0.2")) == (200, None)
+    assert route.counters["rate_limited_client"] == 1
+
+
+def test_route_rate_limit_returns_429_without_using_client_token():
+    route = make_route(rate=0.25, burst=1, client_rate=1e-9, client_burst=5)
+    middleware = make_middleware(route)
+
+    assert asyncio.run(call(middleware, client="10.0.0.1")) == (200, None)
+    assert asyncio.run(call(middleware, client="10.0.0.2")) == (429, b"4")
+    assert route.counters["rate_limited_route"] == 1
+    assert route.clients["10.0.0.2"].tokens == pytest.approx(5)
+
+
+def test_client_rate_limit_does_not_use_route_token():
+    route = make_route(rate=1e-9, burst=5, client_rate=1e-9, client_burst=1)
+    middleware = make_middleware(route)
+
+    asyncio.run(call(middleware))
+    asyncio.run(call(middleware))
+    assert route.bucket.tokens == pytest.approx(4)
+
+
+def test_queue_full_sheds_with_503_and_refunds_tokens():
+    route = make_route(
+        rate=1e-9,
+        burst=5,
+        client_rate=1e-9,
+        client_burst=5,
+        max_in_flight=1,
+        max_queue=0,
+    )
+    middleware = make_middleware(route, delay=0.1)
+
+    results = run_concurrently(call(middleware), call(middleware))
+
+    assert results == [(200, None), (503, b"1")]
+    assert route.counters["shed_queue_full"] == 1
+    # Only the admitted request keeps its tokens
+    assert route.bucket.tokens == pytest.approx(4)
+    assert route.clients["10.0.0.1"].tokens == pytest.approx(4)
+
+
+def test_queue_timeout_sheds_with_503_and_refunds_tokens():
+    route = make_route(
+        rate=1e-9,
+        burst=5,
+        client_rate=1e-9,
+        client_burst=5,
+        max_in_flight=1,
+        max_queue_delay=0.05,
+    )
+    middleware = make_middleware(route, delay=0.2)
+
+    results = run_concurrently(call(middleware), call(middleware))
+
+    assert results == [(200, None), (503, b"1")]
+    assert route.counters["queued"] == 1
+    assert route.counters["shed_queue_timeout"] == 1
+    assert route.queued == 0
+    assert route.bucket.tokens == pytest.approx(4)
+    assert route.clients["10.0.0.1"].tokens == pytest.approx(4)
+
+
+def test_queued_request_is_admitted_when_slot_frees():
+    route = make_route(max_in_flight=1, max_queue_delay=1.0)
+    middleware = make_middleware(route, delay=0.05)
+
+    results = run_concurrently(call(middleware), call(middleware))
+
+    assert results == [(200, None), (200, None)]
+    assert route.counters["admitted"] == 2
+    assert route.queue_delay > 0
+
+
+def test_queue_delay_above_target_sheds_immediately():
+    route = make_route(
+        rate=1e-9,
+        burst=5,
+        client_rate=1e-9,
+        client_burst=5,
+        max_in_flight=1,
+        target_queue_delay=0.1,
+    )
+    route.queue_delay = 0.5
+    middleware = make_middleware(route, delay=0.1)
+
+    results = run_concurrently(call(middleware), call(middleware))
+
+    assert results == [(200, None), (503, b"1")]
+    assert route.counters["shed_queue_delay"] == 1
+    assert route.counters["queued"] == 0
+    assert route.bucket.tokens == pytest.approx(4)
+    assert route.clients["10.0.0.1"].tokens == pytest.approx(4)
+
+
+def test_client_buckets_evict_least_recently_seen(monkeypatch):
+    monkeypatch.setattr(admission, "MAX_TRACKED_CLIENTS", 3)
+    route = make_route()
+    middleware = make_middleware(route)
+
+    for client in ["a", "b", "c", "a", "d"]:
+        asyncio.run(call(middleware, client=client))
+
+    assert list(route.clients) == ["c", "a", "d"]
@@ -0,0 +1,31 @@
+import httpx
+from config import get_env
+
+DEFAULT_ODDS_API_BASE_URL = "https://api.the-odds-api.com/v4"
+
+_client = None
+
+
+def get_api_key():
+    return get_env("API_KEY")
+
+
+def sports_url():
+    # Point ODDS_API_BASE_URL at a local mock (see benchmarks/mock_oddsapi.py) to avoid burning quota
+    base_url = get_env("ODDS_API_BASE_URL", DEFAULT_ODDS_API_BASE_URL)
+    return f"{base_url.rstrip('/')}/sports"
+
+
+def get_client():
+    """Shared client so connections to the Odds API are pooled across requests."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient()
+    return _client
+
+
+async def close_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None